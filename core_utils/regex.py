@@ -1,6 +1,7 @@
-import os
+import functools
 import re
 from typing import Optional
+from typing import Union
 
 
 def get_trailing_numbers_as_string(s: str) -> Optional[str]:
@@ -15,8 +16,15 @@ def get_trailing_numbers_as_string(s: str) -> Optional[str]:
         Optional[str]: The string og digits at the end of the string if one
             exists. Returns None if no digits exists.
     """
-    temp = re.search(r"\d+$", s)
-    return str(temp.group()) if temp else None
+    if not isinstance(s, str):
+        raise TypeError(f"expected str, got {type(s).__name__}")
+
+    # Like a regex '$', allow the digits to sit before a single trailing newline
+    end = len(s) - 1 if s.endswith("\n") else len(s)
+    i = end
+    while i and "0" <= s[i - 1] <= "9":
+        i -= 1
+    return s[i:end] if i < end else None
 
 
 def get_trailing_numbers_as_int(s: str) -> Optional[int]:
@@ -32,7 +40,8 @@ def get_trailing_numbers_as_int(s: str) -> Optional[int]:
         Returns None if no integer exists.
     """
     try:
-        return int(get_trailing_numbers_as_string(s))
+        digits = get_trailing_numbers_as_string(s)
+        return int(digits) if digits else None
     except (TypeError, ValueError):
         return None
 
@@ -50,28 +59,22 @@ def is_path_like(value: str) -> bool:
     if not isinstance(value, str):
         return False
 
-    # Check for Windows drive-letter root (e.g. C:\ or D:/)
-    if re.match(r"^[a-zA-Z]:[\\/]", value):
-        return True
-
-    # Check for UNC path (e.g. \\server\share)
-    if value.startswith("\\\\"):
+    # Drive-letter roots (C:\ or D:/), UNC paths (\\server\share) and
+    # relative Windows-style paths (.\ or ..\) all contain a separator, so a
+    # single separator check covers every one of them.
+    if "\\" in value or "/" in value:
         return True
 
-    # Relative Windows-style path (starts with .\ or ..\)
-    if value.startswith((".\\", "..\\")):
-        return True
+    # Looks like a filename with an extension. Mirrors os.path.splitext, where
+    # leading dots (e.g. '.gitignore') do not start an extension.
+    dot = value.rfind(".")
+    if dot < 0 or not value[:dot].lstrip("."):
+        return False
 
-    # Contains backslashes or forward slashes
-    if "\\" in value or "/" in value:
-        return True
+    return len(value) - dot <= 7
 
-    # Looks like a filename with an extension
-    _, ext = os.path.splitext(value)
-    if ext and len(ext) <= 7:
-        return True
 
-    return False
+_NO_SPECIAL_CHARS_RE = re.compile(r"^[a-zA-Z0-9_]*$")
 
 
 def validation_no_special_chars(string: str) -> bool:
@@ -88,13 +91,27 @@ def validation_no_special_chars(string: str) -> bool:
     Notes:
         A common gotcha is that whitespace counts as a special character.
     """
-    m = re.match(r"^[a-zA-Z0-9_]*$", string)
+    m = _NO_SPECIAL_CHARS_RE.match(string)
     if m and string != "":
         return True
     else:
         return False
 
 
+_NATURAL_SORT_SPLIT_RE = re.compile(r"([0-9]+)")
+
+
+def _natural_sort_key(key: str) -> tuple[Union[int, str], ...]:
+    """Split a string into alternating text and integer chunks for sorting."""
+    # Copied from studio library
+    return tuple(
+        [
+            int(text) if text.isdigit() else text
+            for text in _NATURAL_SORT_SPLIT_RE.split(key)
+        ]
+    )
+
+
 def natural_sort_strings(items: list[str]):
     """
     Sort the given list in the way that humans expect.
@@ -102,19 +119,71 @@ def natural_sort_strings(items: list[str]):
     Args:
         list[str]: The list of strings to sort.
     """
-    # Copied from studio library
-    convert = lambda text: int(text) if text.isdigit() else text
-    alphanum_key = lambda key: [convert(c) for c in re.split(r"([0-9]+)", key)]
-    items.sort(key=alphanum_key)
+    items.sort(key=_natural_sort_key)
+
+
+def natural_sort_strings_many(lists: list[list[str]]) -> None:
+    """
+    Sort each of the given lists in the way that humans expect.
+
+    Sort keys are shared between all lists, so strings that show up more than
+    once, in the same list or in several, are only parsed once. Prefer this
+    over repeated natural_sort_strings calls when sorting many overlapping
+    lists, e.g. the contents of several render directories.
+
+    Args:
+        lists (list[list[str]]): The lists of strings to sort in place.
+    """
+    cache: dict[str, tuple[Union[int, str], ...]] = {}
+
+    def cached_key(key: str) -> tuple[Union[int, str], ...]:
+        result = cache.get(key)
+        if result is None:
+            result = cache[key] = _natural_sort_key(key)
+        return result
+
+    for items in lists:
+        items.sort(key=cached_key)
 
 
 # -----Casing------------------------------------------------------------------
 
 
+# Identifiers are converted over and over from a small vocabulary (class and
+# field names), so the converters that do real work remember their results.
+_CASE_CACHE_SIZE = 4096
+
+
+def _to_snake(s: str) -> str:
+    """
+    Single pass conversion of PascalCase or camelCase to snake_case.
+
+    An underscore is placed before an ASCII uppercase letter (other than the
+    first character) when it follows an ASCII lowercase letter or digit, or
+    when it is followed by an ASCII lowercase letter, i.e. it starts a new
+    capitalized word (e.g. the 'R' in 'HTTPResponse') and does not follow a
+    newline. The result is then lowercased.
+    """
+    out = []
+    prev = ""
+    last = len(s) - 1
+    for i, c in enumerate(s):
+        if "A" <= c <= "Z" and i:
+            if "a" <= prev <= "z" or "0" <= prev <= "9":
+                out.append("_")
+            # Word starts after a newline get no underscore, matching the
+            # (.)([A-Z][a-z]+) regex this replaces, where '.' skips newlines.
+            elif prev != "\n" and i < last and "a" <= s[i + 1] <= "z":
+                out.append("_")
+        out.append(c)
+        prev = c
+    return "".join(out).lower()
+
+
+@functools.lru_cache(maxsize=_CASE_CACHE_SIZE)
 def pascal_to_snake(s: str) -> str:
     """Converts PascalCase to snake_case."""
-    s1 = re.sub(r"(.)([A-Z][a-z]+)", r"\1_\2", s)
-    return re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", s1).lower()
+    return _to_snake(s)
 
 
 def pascal_to_camel(s: str) -> str:
@@ -122,10 +191,10 @@ def pascal_to_camel(s: str) -> str:
     return s[0].lower() + s[1:] if s else s
 
 
+@functools.lru_cache(maxsize=_CASE_CACHE_SIZE)
 def camel_to_snake(s: str) -> str:
     """Converts camelCase to snake_case."""
-    s1 = re.sub(r"(.)([A-Z][a-z]+)", r"\1_\2", s)
-    return re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", s1).lower()
+    return _to_snake(s)
 
 
 def camel_to_pascal(s: str) -> str:
@@ -133,14 +202,16 @@ def camel_to_pascal(s: str) -> str:
     return s[0].upper() + s[1:] if s else s
 
 
+@functools.lru_cache(maxsize=_CASE_CACHE_SIZE)
 def snake_to_pascal(s: str) -> str:
     """Converts snake_case to PascalCase."""
-    return "".join(word.capitalize() for word in s.split("_") if word)
+    return "".join([word.capitalize() for word in s.split("_") if word])
 
 
+@functools.lru_cache(maxsize=_CASE_CACHE_SIZE)
 def snake_to_camel(s: str) -> str:
     """Converts snake_case to camelCase."""
     words = [w for w in s.split("_") if w]
-    return (
-        words[0].lower() + "".join(w.capitalize() for w in words[1:]) if words else ""
-    )
+    if not words:
+        return ""
+    return words[0].lower() + "".join([w.capitalize() for w in words[1:]])
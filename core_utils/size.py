@@ -1,4 +1,7 @@
-import math
+from fractions import Fraction
+
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB", "EB", "ZB", "YB")
 
 
 def convert_size(size_bytes: int) -> tuple[float, str]:
@@ -10,15 +13,21 @@ def convert_size(size_bytes: int) -> tuple[float, str]:
         size_bytes (int): How many bytes to rename.
     Returns:
         tuple[float, str]: The new unit size and the new unit label.
+    Raises:
+        ValueError: if size_bytes is negative.
     """
     if size_bytes == 0:
         return 0, "B"
-    size_name: list[str] = ["B", "KB", "MB", "GB", "TB", "PB", "EB", "ZB", "YB"]
-    i = int(math.floor(math.log(size_bytes, 1024)))
-    p = math.pow(1024, i)
-    s = round(size_bytes / p, 2)
+    if size_bytes < 0:
+        raise ValueError(f"Size cannot be negative: {size_bytes}")
+
+    # Each unit is 2^10 times the previous one, so the unit index is how many
+    # whole groups of 10 bits sit below the highest set bit.
+    i = (int(size_bytes).bit_length() - 1) // 10
+    i = min(max(i, 0), len(_SIZE_UNITS) - 1)
+    s = round(size_bytes / (1 << (i * 10)), 2)
 
-    return s, size_name[i]
+    return s, _SIZE_UNITS[i]
 
 
 MM = "mm"
@@ -30,16 +39,53 @@ FT = "ft"
 YD = "yd"
 MI = "mi"
 
+# Length of one of each unit in centimeters, kept exact so the derived factors
+# are correctly rounded.
+_CM_PER_UNIT: dict[str, Fraction] = {
+    MM: Fraction(1, 10),
+    CM: Fraction(1),
+    M: Fraction(100),
+    KM: Fraction(100000),
+    IN: Fraction("2.54"),
+    FT: Fraction("30.48"),
+    YD: Fraction("91.44"),
+    MI: Fraction(160900),
+}
+
+
+def _conversion_factor(from_cm: Fraction, to_cm: Fraction) -> tuple[float, float]:
+    """
+    Returns the (multiplier, divisor) pair for converting between two units.
+    Shrinking conversions divide by the inverse ratio rather than multiplying
+    by a rounded reciprocal, e.g. 91.44 cm / 91.44 is exactly 1 yd whereas
+    91.44 * (1 / 91.44) is not.
+    """
+    ratio = from_cm / to_cm
+    if ratio >= 1:
+        return float(ratio), 1.0
+    return 1.0, float(1 / ratio)
+
+
+# Direct factors for every unit pair, indexed [from_unit][to_unit], so a
+# conversion never takes a trip through centimeters. Nested dicts avoid
+# building and hashing a tuple key on every lookup.
+_CONVERSION_FACTORS: dict[str, dict[str, tuple[float, float]]] = {
+    from_unit: {
+        to_unit: _conversion_factor(from_cm, to_cm)
+        for to_unit, to_cm in _CM_PER_UNIT.items()
+    }
+    for from_unit, from_cm in _CM_PER_UNIT.items()
+}
+
 
 class ScaleHandler(object):
     """
     A scale handling class that can be used to convert any common unit
     to another unit.
 
-    Instead of containing formulas for every possible conversion, the
-    class has a conversion from every common unit to centimeter and
-    from centimeter to every common unit. Common unit types are
-    [MM, CM, M, KM, IN, FT, YD, MI].
+    Every unit is defined by its length in centimeters, from which a direct
+    conversion factor between each pair of units is precomputed. Common unit
+    types are [MM, CM, M, KM, IN, FT, YD, MI].
 
     Relevant methods:
         convert_to_unit(unit: str) -> float:
@@ -57,6 +103,8 @@ class ScaleHandler(object):
         >>> print(scale.unit)
     """
 
+    __slots__ = ("unit", "length")
+
     def __init__(self, unit: str = CM, length: float = 1.0) -> None:
         self.unit = unit
         self.length = length
@@ -78,127 +126,14 @@ class ScaleHandler(object):
         Returns:
             float: The converted length.
         """
-        if self.unit == MM:
-            self._convert_mm_to_cm(self.length)
-            return self._convert_to_unit(unit)
-        elif self.unit == M:
-            self._convert_m_to_cm(self.length)
-            return self._convert_to_unit(unit)
-        elif self.unit == KM:
-            self._convert_km_to_cm(self.length)
-            return self._convert_to_unit(unit)
-        elif self.unit == IN:
-            self._convert_in_to_cm(self.length)
-            return self._convert_to_unit(unit)
-        elif self.unit == FT:
-            self._convert_ft_to_cm(self.length)
-            return self._convert_to_unit(unit)
-        elif self.unit == YD:
-            self._convert_yd_to_cm(self.length)
-            return self._convert_to_unit(unit)
-        elif self.unit == MI:
-            self._convert_mi_to_cm(self.length)
-            return self._convert_to_unit(unit)
-        elif self.unit == CM:
-            return self._convert_to_unit(unit)
-        else:
-            raise ValueError(f"Unsupported unit {self.unit}")
-
-    def _convert_to_unit(self, unit: str) -> float:
-        if unit == MM:
-            self._convert_cm_to_mm(self.length)
-        elif unit == M:
-            self._convert_cm_to_m(self.length)
-        elif unit == KM:
-            self._convert_cm_to_km(self.length)
-        elif unit == IN:
-            self._convert_cm_to_in(self.length)
-        elif unit == FT:
-            self._convert_cm_to_ft(self.length)
-        elif unit == YD:
-            self._convert_cm_to_yd(self.length)
-        elif unit == MI:
-            self._convert_cm_to_mi(self.length)
-        elif unit == CM:
-            # Already in CM, no conversion needed
-            pass
-        else:
-            raise ValueError(f"Unsupported unit {unit}")
-
-        return self.length
-
-    # -- Convert cm to unit --
-    # Metric
-    def _convert_cm_to_mm(self, num: float) -> float:
-        self.length = num * 10.0
-        self.unit = MM
-        return self.length
-
-    def _convert_cm_to_m(self, num: float) -> float:
-        self.length = num / 100.0
-        self.unit = M
-        return self.length
-
-    def _convert_cm_to_km(self, num: float) -> float:
-        self.length = num / 100000.0
-        self.unit = KM
-        return self.length
-
-    # Customary
-    def _convert_cm_to_in(self, num: float) -> float:
-        self.length = num / 2.54
-        self.unit = IN
-        return self.length
-
-    def _convert_cm_to_ft(self, num: float) -> float:
-        self.length = num / 30.48
-        self.unit = FT
-        return self.length
-
-    def _convert_cm_to_yd(self, num: float) -> float:
-        self.length = num / 91.44
-        self.unit = YD
-        return self.length
-
-    def _convert_cm_to_mi(self, num: float) -> float:
-        self.length = num / 160900.0
-        self.unit = MI
-        return self.length
-
-    # -- Convert unit to cm --
-    # Metric
-    def _convert_mm_to_cm(self, num: float) -> float:
-        self.length = num / 10.0
-        self.unit = CM
-        return self.length
-
-    def _convert_m_to_cm(self, num: float) -> float:
-        self.length = num * 100.0
-        self.unit = CM
-        return self.length
-
-    def _convert_km_to_cm(self, num: float) -> float:
-        self.length = num * 100000.0
-        self.unit = CM
-        return self.length
-
-    # Customary
-    def _convert_in_to_cm(self, num: float) -> float:
-        self.length = num * 2.54
-        self.unit = CM
-        return self.length
-
-    def _convert_ft_to_cm(self, num: float) -> float:
-        self.length = num * 30.48
-        self.unit = CM
-        return self.length
-
-    def _convert_yd_to_cm(self, num: float) -> float:
-        self.length = num * 91.44
-        self.unit = CM
-        return self.length
-
-    def _convert_mi_to_cm(self, num: float) -> float:
-        self.length = num * 160900.0
-        self.unit = CM
+        try:
+            multiplier, divisor = _CONVERSION_FACTORS[self.unit][unit]
+        except (KeyError, TypeError):
+            # TypeError covers unhashable units, e.g. a list passed by mistake
+            source_ok = isinstance(self.unit, str) and self.unit in _CM_PER_UNIT
+            bad_unit = unit if source_ok else self.unit
+            raise ValueError(f"Unsupported unit {bad_unit}") from None
+
+        self.length = self.length * multiplier / divisor
+        self.unit = unit
         return self.length
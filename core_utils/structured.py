@@ -1,12 +1,34 @@
 import csv
+import functools
 import json
+from concurrent.futures import ThreadPoolExecutor
 from xml.etree import ElementTree
 from pathlib import Path
+from types import ModuleType
 from typing import Any
+from typing import IO
+from typing import Iterable
+from typing import Iterator
 from typing import Optional
 from typing import Union
 
-import yaml
+
+def _open_for_write(
+    path: Path, overwrite: bool, mode: str = "w", **kwargs: Any
+) -> Optional[IO]:
+    """
+    Open path for writing in a single call.
+    Without overwrite the file is created exclusively, so an existing file is
+    left untouched and None is returned, with no window between checking for
+    the file and creating it.
+    """
+    if not overwrite:
+        mode = mode.replace("w", "x")
+
+    try:
+        return open(path, mode, **kwargs)
+    except FileExistsError:
+        return None
 
 
 # -----Json--------------------------------------------------------------------
@@ -28,11 +50,16 @@ def export_data_to_json(
         overwrite(bool): to overwrite JSON file if it already exists in path.
             Defaults to False.
     """
-    if not overwrite and path.exists():
+    # Serializing up front means a failure never leaves an empty file behind,
+    # and writing the string once is cheaper than json.dump's chunked writes.
+    payload = json.dumps(data, indent=4)
+
+    outfile = _open_for_write(path, overwrite)
+    if outfile is None:
         return
 
-    with open(path, "w") as outfile:
-        json.dump(data, outfile, indent=4)
+    with outfile:
+        outfile.write(payload)
 
 
 def import_data_from_json(filepath: Path) -> Optional[dict]:
@@ -55,6 +82,21 @@ def import_data_from_json(filepath: Path) -> Optional[dict]:
 # -----Yaml--------------------------------------------------------------------
 
 
+@functools.cache
+def _yaml_backend() -> tuple[ModuleType, type, type]:
+    """
+    Imports PyYAML on first use, as it is by far the slowest import in this
+    module. Returns the yaml module, loader and dumper, preferring the
+    libyaml backed C loader when PyYAML was built with it. The pure-Python
+    dumper is always used, as libyaml's emitter formats some documents
+    differently and exported files should not depend on how PyYAML was built.
+    """
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml, loader, yaml.Dumper
+
+
 YAML_TYPE = Union[dict, list, int, float, bool, str, None]
 YAML_EXPORT_TYPE = Union[dict[YAML_TYPE, YAML_TYPE], list[YAML_TYPE]]
 
@@ -71,11 +113,19 @@ def export_data_to_yaml(
         overwrite(bool): to overwrite YAML file if it already exists in path.
             Defaults to False.
     """
-    if not overwrite and path.exists():
+    outfile = _open_for_write(path, overwrite)
+    if outfile is None:
         return
 
-    with open(path, "w") as outfile:
-        yaml.dump(data, outfile, default_flow_style=False, sort_keys=False)
+    yaml, _, dumper = _yaml_backend()
+    with outfile:
+        yaml.dump(
+            data,
+            outfile,
+            Dumper=dumper,
+            default_flow_style=False,
+            sort_keys=False,
+        )
 
 
 def import_data_from_yaml(filepath: Path) -> Optional[dict]:
@@ -90,8 +140,9 @@ def import_data_from_yaml(filepath: Path) -> Optional[dict]:
     if not filepath.exists():
         return None
 
+    yaml, loader, _ = _yaml_backend()
     with open(filepath) as file:
-        data = yaml.safe_load(file)
+        data = yaml.load(file, Loader=loader)
         return data
 
 
@@ -114,13 +165,17 @@ def export_data_to_xml(
             Defaults to False.
         root_tag (str): the tag name for the root element. Defaults to "root".
     """
-    if not overwrite and path.exists():
-        return
-
+    # Build the tree before opening the file so a failure leaves no file behind
     root = _dict_to_xml(data, root_tag)
     tree = ElementTree.ElementTree(root)
     ElementTree.indent(tree, space="    ")
-    tree.write(path, encoding="utf-8", xml_declaration=True)
+
+    outfile = _open_for_write(path, overwrite, "wb")
+    if outfile is None:
+        return
+
+    with outfile:
+        tree.write(outfile, encoding="utf-8", xml_declaration=True)
 
 
 def _dict_to_xml(data: XML_PARSED_TYPE, tag: str) -> ElementTree.Element:
@@ -128,13 +183,9 @@ def _dict_to_xml(data: XML_PARSED_TYPE, tag: str) -> ElementTree.Element:
     element = ElementTree.Element(tag)
 
     if isinstance(data, dict):
-        for key, val in data.items():
-            child = _dict_to_xml(val, key)
-            element.append(child)
+        element.extend([_dict_to_xml(val, key) for key, val in data.items()])
     elif isinstance(data, list):
-        for item in data:
-            child = _dict_to_xml(item, "item")
-            element.append(child)
+        element.extend([_dict_to_xml(item, "item") for item in data])
     else:
         element.text = str(data)
 
@@ -153,34 +204,53 @@ def import_data_from_xml(filepath: Path) -> Optional[dict]:
     if not filepath.exists():
         return None
 
-    tree = ElementTree.parse(filepath)
-    root = tree.getroot()
-    data = _xml_to_dict(root)
-    return data
-
-
-def _xml_to_dict(element: ElementTree.Element) -> Union[dict, list, str]:
-    """Convert XML Element to dict."""
+    # Elements are converted as soon as they close and are then dropped from
+    # their parent, so only the open branch of the tree is held in memory
+    # instead of the whole document.
+    open_elements: list[ElementTree.Element] = []
+    children_stack: list[list[tuple[str, XML_PARSED_TYPE]]] = [[]]
+    for event, element in ElementTree.iterparse(filepath, events=("start", "end")):
+        if event == "start":
+            open_elements.append(element)
+            children_stack.append([])
+            continue
+
+        children = children_stack.pop()
+        value = _xml_to_value(element.text, children)
+        children_stack[-1].append((element.tag, value))
+
+        open_elements.pop()
+        element.clear()
+        if open_elements:
+            # Children close in document order, so the finished element is
+            # always the first one its parent still holds.
+            del open_elements[-1][0]
+
+    return children_stack[0][0][1]
+
+
+def _xml_to_value(
+    text: Optional[str], children: list[tuple[str, XML_PARSED_TYPE]]
+) -> XML_PARSED_TYPE:
+    """Convert an XML element's text and converted (tag, value) children."""
     # If element has no children, return its text
-    if len(element) == 0:
-        return element.text if element.text else ""
+    if not children:
+        return text if text else ""
 
     # Check if all children have the same tag (list-like)
-    children_tags = [child.tag for child in element]
-    if len(set(children_tags)) == 1:
-        return [_xml_to_dict(child) for child in element]
+    if len({tag for tag, _ in children}) == 1:
+        return [value for _, value in children]
 
     # Otherwise, treat as dict
     result = {}
-    for child in element:
-        child_data = _xml_to_dict(child)
-        if child.tag in result:
+    for tag, value in children:
+        if tag in result:
             # Handle duplicate keys by converting to list
-            if not isinstance(result[child.tag], list):
-                result[child.tag] = [result[child.tag]]
-            result[child.tag].append(child_data)
+            if not isinstance(result[tag], list):
+                result[tag] = [result[tag]]
+            result[tag].append(value)
         else:
-            result[child.tag] = child_data
+            result[tag] = value
 
     return result
 
@@ -216,13 +286,14 @@ def export_data_to_csv(
             If not provided and data is list of dicts, uses dict keys.
             If not provided and data is list of lists, uses first row as headers.
     """
-    if not overwrite and path.exists():
+    if not data:
         return
 
-    if not data:
+    outfile = _open_for_write(path, overwrite, newline="")
+    if outfile is None:
         return
 
-    with open(path, "w", newline="") as outfile:
+    with outfile:
         if isinstance(data[0], dict):
             # List of dicts
             if fieldnames is None:
@@ -256,11 +327,77 @@ def import_data_from_csv(
     if not filepath.exists():
         return None
 
+    return list(iter_data_from_csv(filepath, as_dict))
+
+
+def iter_data_from_csv(
+    filepath: Path, as_dict: bool = True
+) -> Iterator[Union[dict[str, str], list[str]]]:
+    """
+    Lazily iterate over the rows of a .csv file.
+    Rows are read as they are consumed instead of being collected up front,
+    which keeps memory flat for large files processed one row at a time.
+
+    Args:
+        filepath (Path): the filepath to the CSV file to extract data from.
+        as_dict (bool): if True, yields dicts with headers as keys.
+            If False, yields lists including header row.
+            Defaults to True.
+    Yields:
+        dict[str, str] | list[str]: the next row of the CSV file.
+    Raises:
+        FileNotFoundError: on first iteration if the CSV file does not exist.
+    """
     with open(filepath, newline="") as file:
         if as_dict:
-            reader = csv.DictReader(file)
-            data = list(reader)
+            yield from csv.DictReader(file)
         else:
-            reader = csv.reader(file)
-            data = list(reader)
-        return data
+            yield from csv.reader(file)
+
+
+# -----Batch-------------------------------------------------------------------
+
+
+_EXPORTERS = {
+    "json": export_data_to_json,
+    "yaml": export_data_to_yaml,
+    "xml": export_data_to_xml,
+    "csv": export_data_to_csv,
+}
+
+
+def export_many(
+    items: Iterable[tuple[Path, Any]],
+    fmt: str = "json",
+    overwrite: bool = False,
+    max_workers: int = 8,
+) -> None:
+    """
+    Export many independent files in parallel.
+    File writes release the GIL, so a thread pool lets many small exports
+    overlap their disk I/O instead of running back to back.
+
+    Args:
+        items (Iterable[tuple[Path, Any]]): (path, data) pairs to export.
+        fmt (str): the export format, one of 'json', 'yaml', 'xml' or 'csv'.
+            Defaults to 'json'.
+        overwrite(bool): to overwrite files that already exist.
+            Defaults to False.
+        max_workers (int): the maximum number of threads exporting at once.
+            Defaults to 8.
+    Raises:
+        ValueError: if fmt is not a supported export format.
+    """
+    try:
+        exporter = _EXPORTERS[fmt]
+    except KeyError:
+        raise ValueError(f"Unsupported export format {fmt}") from None
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(exporter, path, data, overwrite) for path, data in items
+        ]
+
+    # Re-raise the first export error, if any
+    for future in futures:
+        future.result()
@@ -1,25 +1,30 @@
 import datetime
+import functools
 import platform
 
 
 def get_date() -> str:
     """Returns str: 'MM-DD-YYYY'"""
     today = datetime.date.today()
-    return today.strftime("%m-%d-%Y")
+    return f"{today.month:02d}-{today.day:02d}-{today.year}"
 
 
 def get_time() -> str:
-    """Returns str: 'HH:MM:SS:XX', X is microsecond."""
-    now = datetime.datetime.now().time().isoformat()[:-4]
-    return now
+    """Returns str: 'HH:MM:SS.XX', X is centisecond."""
+    # Always emit microseconds, isoformat() omits them when they are zero.
+    now = datetime.datetime.now().time().isoformat(timespec="microseconds")
+    return now[:-4]
 
 
+@functools.cache
 def get_os_info() -> tuple[str, str, str]:
     """
     Returns tuple[str, str, str]: OS name, release number, and version number.
 
     Notes:
         On many python versions, Windows 11 is seen as Windows 10.
+        The result is cached after the first call, as it cannot change for
+        the lifetime of the process. Use get_os_info.cache_clear() to reset.
     """
     system = platform.system()
     release = platform.release()
@@ -42,6 +42,8 @@ def print_error_msg(msg: str, custom_tag: Optional[str] = None) -> None:
 class ProgressBar(object):
     """
     A progress bar that outputs to stderr for tracking progress when looping.
+    Redraws are throttled to the terminal refresh rate, the final frame is
+    always drawn.
 
     Example usages:
     >>> for _ in ProgressBar(range(11)):
@@ -51,18 +53,26 @@ class ProgressBar(object):
         data(sequence): Any sequence data type that can be looped through.
     """
 
+    _BAR_LENGTH = 20
+    # Leading carriage return rewinds the line so each draw overwrites the last.
+    _BAR_FORMAT = "\r|%s| %.2f%% - Iteration time: %.4f seconds"
+    # Minimum seconds between redraws, roughly a 30 Hz terminal refresh.
+    _REDRAW_INTERVAL = 1.0 / 30.0
+
     def __init__(self, data: Sequence[Any]):
         self.data = data
+        self.total = len(data)
         self.index = 0
         self.start_time = time.perf_counter()
         self.last_time = self.start_time
         self.iteration_time = time.perf_counter()
+        self.last_draw_time = float("-inf")
 
     def __iter__(self) -> "ProgressBar":
         return self
 
     def __next__(self) -> Any:
-        if self.index < len(self.data):
+        if self.index < self.total:
             result = self.data[self.index]
             self.index += 1
 
@@ -70,7 +80,14 @@ class ProgressBar(object):
             self.iteration_time = current_time - self.last_time
             self.last_time = current_time
 
-            self.draw_progress_bar()
+            # Each draw is a flushed stderr write, which dominates fast loops.
+            # Redraw at most at the refresh rate, but always show the last frame.
+            if (
+                current_time - self.last_draw_time >= self._REDRAW_INTERVAL
+                or self.index == self.total
+            ):
+                self.last_draw_time = current_time
+                self.draw_progress_bar()
             return result
         else:
             raise StopIteration
@@ -81,18 +98,11 @@ class ProgressBar(object):
         current index of the sequence data item.
         Will flush stderr each time the progress bar is drawn.
         """
-        percent = self.index / len(self.data)
-        bar_len = 20
-        sys.stderr.write("\r")
-        progress = ""
-        for i in range(bar_len):
-            if i < int(bar_len * percent):
-                progress += "█"
-            else:
-                progress += " "
-
-        progress_bar_str = "|%s| %.2f%% - Iteration time: %.4f seconds"
+        percent = self.index / self.total
+        filled = int(self._BAR_LENGTH * percent)
+        progress = "█" * filled + " " * (self._BAR_LENGTH - filled)
+
         sys.stderr.write(
-            progress_bar_str % (progress, percent * 100, self.iteration_time)
+            self._BAR_FORMAT % (progress, percent * 100, self.iteration_time)
         )
         sys.stderr.flush()
@@ -1,3 +1,5 @@
+import pytest
+
 from core_utils import regex
 
 
@@ -21,6 +23,20 @@ class TestTrailingNumbers:
     def test_get_trailing_numbers_as_string_empty(self):
         assert regex.get_trailing_numbers_as_string("") is None
 
+    def test_get_trailing_numbers_as_string_ascii_digits_only(self):
+        assert regex.get_trailing_numbers_as_string("file\u00b2") is None
+        assert regex.get_trailing_numbers_as_string("file\u0661\u0662") is None
+        assert regex.get_trailing_numbers_as_string("v\u00b27") == "7"
+
+    def test_get_trailing_numbers_as_string_trailing_newline(self):
+        assert regex.get_trailing_numbers_as_string("file123\n") == "123"
+        assert regex.get_trailing_numbers_as_string("9\n") == "9"
+        assert regex.get_trailing_numbers_as_string("file123\n\n") is None
+
+    def test_get_trailing_numbers_as_string_non_string(self):
+        with pytest.raises(TypeError):
+            regex.get_trailing_numbers_as_string([])
+
     def test_get_trailing_numbers_as_int_basic(self):
         assert regex.get_trailing_numbers_as_int("file123") == 123
         assert regex.get_trailing_numbers_as_int("render001") == 1
@@ -30,9 +46,16 @@ class TestTrailingNumbers:
         assert regex.get_trailing_numbers_as_int("filename") is None
         assert regex.get_trailing_numbers_as_int("test_file") is None
 
+    def test_get_trailing_numbers_as_int_non_string(self):
+        assert regex.get_trailing_numbers_as_int(["1"]) is None
+        assert regex.get_trailing_numbers_as_int(None) is None
+
     def test_get_trailing_numbers_as_int_large_number(self):
         assert regex.get_trailing_numbers_as_int("frame999999") == 999999
 
+    def test_get_trailing_numbers_as_int_exceeds_digit_limit(self):
+        assert regex.get_trailing_numbers_as_int("f" + "1" * 5000) is None
+
 
 class TestIsPathLike:
     """Tests for path detection function."""
@@ -73,6 +96,15 @@ class TestIsPathLike:
         # Extensions longer than 7 chars should return False
         assert regex.is_path_like("file.verylongext") is False
 
+    def test_extension_length_boundary(self):
+        # The extension check counts the dot, so 6 chars after it is the limit
+        assert regex.is_path_like("file.abcdef") is True
+        assert regex.is_path_like("file.abcdefg") is False
+
+    def test_leading_dots_are_not_extensions(self):
+        assert regex.is_path_like(".gitignore") is False
+        assert regex.is_path_like("..") is False
+
 
 class TestValidationNoSpecialChars:
     """Tests for special character validation."""
@@ -142,6 +174,18 @@ class TestNaturalSortStrings:
         regex.natural_sort_strings(items)
         assert items == ["single"]
 
+    def test_sort_many(self):
+        first = ["file10", "file2", "file1"]
+        second = ["frame_0100", "file2", "frame_0010"]
+        regex.natural_sort_strings_many([first, second])
+        assert first == ["file1", "file2", "file10"]
+        assert second == ["file2", "frame_0010", "frame_0100"]
+
+    def test_sort_many_empty(self):
+        lists = [[], ["single"]]
+        regex.natural_sort_strings_many(lists)
+        assert lists == [[], ["single"]]
+
 
 class TestCaseConversions:
     """Tests for case conversion functions."""
@@ -223,6 +267,12 @@ class TestCaseConversions:
     def test_snake_to_camel_consecutive_underscores(self):
         assert regex.snake_to_camel("test__case") == "testCase"
 
+    def test_case_conversions_are_cached(self):
+        regex.pascal_to_snake.cache_clear()
+        assert regex.pascal_to_snake("CachedName") == "cached_name"
+        assert regex.pascal_to_snake("CachedName") == "cached_name"
+        assert regex.pascal_to_snake.cache_info().hits == 1
+
 
 class TestEdgeCases:
     """Tests for edge cases and special scenarios."""
@@ -230,6 +280,13 @@ class TestEdgeCases:
     def test_pascal_to_snake_numbers(self):
         assert regex.pascal_to_snake("Test123Case") == "test123_case"
 
+    def test_pascal_to_snake_trailing_acronym(self):
+        assert regex.pascal_to_snake("GetHTTP") == "get_http"
+        assert regex.pascal_to_snake("GetHTTPResponseCode") == "get_http_response_code"
+
+    def test_camel_to_snake_single_lowercase_prefix(self):
+        assert regex.camel_to_snake("iPhone") == "i_phone"
+
     def test_snake_to_pascal_leading_underscore(self):
         # Leading underscore creates empty first word
         assert regex.snake_to_pascal("_private_var") == "PrivateVar"
@@ -237,6 +294,13 @@ class TestEdgeCases:
     def test_snake_to_camel_leading_underscore(self):
         assert regex.snake_to_camel("_private_var") == "privateVar"
 
+    def test_snake_to_pascal_uppercase_words(self):
+        assert regex.snake_to_pascal("HTTP_SERVER") == "HttpServer"
+
+    def test_snake_to_camel_lowercases_first_word(self):
+        assert regex.snake_to_camel("User_name") == "userName"
+        assert regex.snake_to_camel("camelCase") == "camelcase"
+
     def test_validation_unicode(self):
         # Unicode characters should be considered special
         assert regex.validation_no_special_chars("test_café") is False
@@ -50,6 +50,18 @@ class TestConvertSize(object):
         s, unit = result
         assert unit == "GB"
 
+    def test_convert_size_just_below_unit_boundary(self) -> None:
+        result = size.convert_size(1024**2 - 1)
+        assert result == (1024.0, "KB")
+
+    def test_convert_size_negative_raises_error(self) -> None:
+        with pytest.raises(ValueError):
+            size.convert_size(-1024)
+
+    def test_convert_size_beyond_largest_unit(self) -> None:
+        result = size.convert_size(1024**9)
+        assert result == (1024.0, "YB")
+
 
 # -----ScaleHandler Tests------------------------------------------------------
 
@@ -211,6 +223,22 @@ class TestScaleHandlerConversions(object):
         with pytest.raises(ValueError, match="Unsupported unit invalid"):
             scale.convert_to_unit(size.CM)
 
+    def test_convert_to_unsupported_target_unit_leaves_state(self) -> None:
+        scale = size.ScaleHandler(size.M, 1.0)
+        with pytest.raises(ValueError, match="Unsupported unit invalid"):
+            scale.convert_to_unit("invalid")
+        assert scale.unit == size.M
+        assert scale.length == 1.0
+
+    def test_convert_unhashable_unit_raises_value_error(self) -> None:
+        scale = size.ScaleHandler(size.M, 1.0)
+        with pytest.raises(ValueError, match="Unsupported unit"):
+            scale.convert_to_unit(["x"])
+
+        scale = size.ScaleHandler(["x"], 1.0)
+        with pytest.raises(ValueError, match="Unsupported unit"):
+            scale.convert_to_unit(size.CM)
+
 
 class TestScaleHandlerStateMutation(object):
     def test_scale_handler_updates_length_and_unit(self) -> None:
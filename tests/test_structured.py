@@ -55,6 +55,11 @@ class TestJSON:
         loaded_data = structured.import_data_from_json(json_file)
         assert loaded_data == json_data
 
+    def test_export_data_to_json_unserializable_leaves_no_file(self, json_file):
+        with pytest.raises(TypeError):
+            structured.export_data_to_json(json_file, {"bad": object()})
+        assert not json_file.exists()
+
     def test_import_data_from_json_returns_correct_data(self, json_file, json_data):
         structured.export_data_to_json(json_file, json_data)
         loaded_data = structured.import_data_from_json(json_file)
@@ -118,6 +123,12 @@ class TestYAML:
         loaded_data = structured.import_data_from_yaml(yaml_file)
         assert loaded_data == yaml_data
 
+    def test_export_data_to_yaml_matches_pure_python_dumper(self, yaml_file):
+        data = {"k": "héllo wörld " * 12}
+        structured.export_data_to_yaml(yaml_file, data)
+        expected = yaml.dump(data, default_flow_style=False, sort_keys=False)
+        assert yaml_file.read_text(encoding="utf-8") == expected
+
     def test_import_data_from_yaml_returns_correct_data(self, yaml_file, yaml_data):
         structured.export_data_to_yaml(yaml_file, yaml_data)
         loaded_data = structured.import_data_from_yaml(yaml_file)
@@ -184,6 +195,13 @@ class TestXML:
         tree = ElementTree.parse(xml_file)
         assert tree.getroot().tag == "custom"
 
+    def test_export_data_to_xml_unconvertible_leaves_no_file(self, xml_file):
+        data = {}
+        data["self"] = data
+        with pytest.raises(RecursionError):
+            structured.export_data_to_xml(xml_file, data)
+        assert not xml_file.exists()
+
     def test_import_data_from_xml_returns_correct_data(self, xml_file, xml_data):
         structured.export_data_to_xml(xml_file, xml_data)
         loaded_data = structured.import_data_from_xml(xml_file)
@@ -333,6 +351,22 @@ class TestCSV:
         nonexistent_file = tmp_path / "nonexistent.csv"
         assert structured.import_data_from_csv(nonexistent_file) is None
 
+    def test_iter_data_from_csv_as_dict(self, csv_file, csv_dict_data):
+        structured.export_data_to_csv(csv_file, csv_dict_data)
+        rows = structured.iter_data_from_csv(csv_file, as_dict=True)
+        assert next(rows) == csv_dict_data[0]
+        assert list(rows) == csv_dict_data[1:]
+
+    def test_iter_data_from_csv_as_list(self, csv_file, csv_list_data):
+        structured.export_data_to_csv(csv_file, csv_list_data)
+        rows = structured.iter_data_from_csv(csv_file, as_dict=False)
+        assert list(rows) == csv_list_data
+
+    def test_iter_data_from_csv_raises_for_nonexistent_file(self, tmp_path):
+        rows = structured.iter_data_from_csv(tmp_path / "nonexistent.csv")
+        with pytest.raises(FileNotFoundError):
+            next(rows)
+
     def test_csv_roundtrip_dict(self, csv_file, csv_dict_data):
         structured.export_data_to_csv(csv_file, csv_dict_data)
         loaded_data = structured.import_data_from_csv(csv_file, as_dict=True)
@@ -342,3 +376,38 @@ class TestCSV:
         structured.export_data_to_csv(csv_file, csv_list_data)
         loaded_data = structured.import_data_from_csv(csv_file, as_dict=False)
         assert loaded_data == csv_list_data
+
+
+# -----Batch Tests-------------------------------------------------------------
+
+
+class TestExportMany:
+    def test_export_many_writes_every_file(self, tmp_path):
+        items = [(tmp_path / f"data_{i}.json", {"index": i}) for i in range(10)]
+        structured.export_many(items)
+
+        for path, data in items:
+            assert structured.import_data_from_json(path) == data
+
+    def test_export_many_uses_format(self, tmp_path):
+        items = [(tmp_path / f"data_{i}.yaml", {"index": i}) for i in range(3)]
+        structured.export_many(items, fmt="yaml")
+
+        for path, data in items:
+            assert structured.import_data_from_yaml(path) == data
+
+    def test_export_many_does_not_overwrite_by_default(self, tmp_path):
+        path = tmp_path / "data.json"
+        structured.export_data_to_json(path, {"original": "data"})
+        structured.export_many([(path, {"new": "data"})])
+        assert structured.import_data_from_json(path) == {"original": "data"}
+
+    def test_export_many_overwrites_when_specified(self, tmp_path):
+        path = tmp_path / "data.json"
+        structured.export_data_to_json(path, {"original": "data"})
+        structured.export_many([(path, {"new": "data"})], overwrite=True)
+        assert structured.import_data_from_json(path) == {"new": "data"}
+
+    def test_export_many_unsupported_format_raises_error(self, tmp_path):
+        with pytest.raises(ValueError, match="Unsupported export format toml"):
+            structured.export_many([(tmp_path / "data.toml", {})], fmt="toml")
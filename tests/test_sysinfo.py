@@ -3,6 +3,8 @@ import sys
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
+
 from core_utils import sysinfo
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -77,6 +79,13 @@ class TestGetTime:
         # Should truncate to 2 decimal places (centiseconds)
         assert result == "12:00:00.99"
 
+    @patch("core_utils.sysinfo.datetime.datetime")
+    def test_get_time_whole_second(self, mock_datetime):
+        mock_time = datetime.time(12, 0, 0, 0)
+        mock_datetime.now.return_value.time.return_value = mock_time
+        result = sysinfo.get_time()
+        assert result == "12:00:00.00"
+
     def test_get_time_returns_string(self):
         result = sysinfo.get_time()
         assert isinstance(result, str)
@@ -99,6 +108,12 @@ class TestGetTime:
 
 
 class TestGetOSInfo:
+    @pytest.fixture(autouse=True)
+    def clear_os_info_cache(self):
+        sysinfo.get_os_info.cache_clear()
+        yield
+        sysinfo.get_os_info.cache_clear()
+
     @patch("core_utils.sysinfo.platform.system")
     @patch("core_utils.sysinfo.platform.release")
     @patch("core_utils.sysinfo.platform.version")
@@ -159,3 +174,19 @@ class TestGetOSInfo:
         mock_system.assert_called_once()
         mock_release.assert_called_once()
         mock_version.assert_called_once()
+
+    @patch("core_utils.sysinfo.platform.system")
+    @patch("core_utils.sysinfo.platform.release")
+    @patch("core_utils.sysinfo.platform.version")
+    def test_get_os_info_is_cached(self, mock_version, mock_release, mock_system):
+        mock_system.return_value = "TestOS"
+        mock_release.return_value = "1.0"
+        mock_version.return_value = "Test Version"
+
+        first = sysinfo.get_os_info()
+        second = sysinfo.get_os_info()
+
+        assert first == second
+        mock_system.assert_called_once()
+        mock_release.assert_called_once()
+        mock_version.assert_called_once()
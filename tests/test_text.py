@@ -87,6 +87,7 @@ class TestProgressBar:
         pb = text.ProgressBar(sample_data)
         assert pb.data == sample_data
         assert pb.index == 0
+        assert pb.total == len(sample_data)
         assert pb.start_time > 0
 
     def test_progress_bar_iteration(self, sample_data):
@@ -178,6 +179,20 @@ class TestProgressBar:
         assert "█" in output or " " in output
         assert "100.00%" in output
 
+    def test_progress_bar_throttles_redraws(self):
+        data = list(range(10000))
+        pb = text.ProgressBar(data)
+        stderr_capture = StringIO()
+
+        with patch("sys.stderr", stderr_capture):
+            for _ in pb:
+                pass
+
+        output = stderr_capture.getvalue()
+        assert output.count("\r") < len(data)
+        assert output.endswith("seconds")
+        assert "100.00%" in output.rsplit("\r", 1)[-1]
+
     def test_progress_bar_with_range(self):
         pb = text.ProgressBar(range(10))
         results = []